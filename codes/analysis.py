@@ -13,34 +13,335 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
-import feedparser
-import time
-from datetime import datetime, timedelta
-import json
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
 import warnings
 import logging
-from collections import Counter, defaultdict
-from bs4 import BeautifulSoup
-import urllib.parse
-from io import StringIO, BytesIO
-import xml.etree.ElementTree as ET
+
+# Fast JSON encoding when orjson is available, stdlib otherwise - both return UTF-8 bytes
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, default=str).encode()
 
 # Configure
 warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 
-# Initialize session state
-if 'live_scraped_cache' not in st.session_state:
-    st.session_state.live_scraped_cache = {}
-if 'scrape_timestamps' not in st.session_state:
-    st.session_state.scrape_timestamps = {}
+# Gender obesity profiles - built once at import, shared by every scrape
+_MALE_OBESITY = {
+    'prevalence': 12.8,
+    'diabetes_comorbidity': 18.5,
+    'hypertension_comorbidity': 24.8,
+    'heart_disease_comorbidity': 8.2,
+    'age_distribution': {
+        '18-30': 8.5, '31-45': 16.2, '46-60': 21.4, '60+': 18.9
+    }
+}
+
+_FEMALE_OBESITY = {
+    'prevalence': 15.2,
+    'diabetes_comorbidity': 16.8,
+    'hypertension_comorbidity': 22.1,
+    'heart_disease_comorbidity': 6.4,
+    'age_distribution': {
+        '18-30': 11.2, '31-45': 19.8, '46-60': 24.1, '60+': 16.3
+    }
+}
+
+# ✅ State populations (in millions) - 2023 estimates
+_STATE_POPULATIONS = {
+    'Uttar Pradesh': 238.6, 'Maharashtra': 123.1, 'Bihar': 128.5, 'West Bengal': 97.7,
+    'Tamil Nadu': 77.8, 'Rajasthan': 81.0, 'Karnataka': 67.6, 'Gujarat': 70.1,
+    'Andhra Pradesh': 53.9, 'Odisha': 45.4, 'Telangana': 38.5, 'Kerala': 35.0,
+    'Jharkhand': 38.6, 'Assam': 35.6, 'Punjab': 30.1, 'Chhattisgarh': 29.4,
+    'Haryana': 28.9, 'Uttarakhand': 11.4, 'Himachal Pradesh': 7.3, 'Tripura': 4.2,
+    'Meghalaya': 3.4, 'Manipur': 3.3, 'Nagaland': 2.2, 'Goa': 1.5, 
+    'Arunachal Pradesh': 1.7, 'Mizoram': 1.2, 'Sikkim': 0.7, 'Delhi': 32.9,
+    'Chandigarh': 1.2, 'Puducherry': 1.4, 'Jammu and Kashmir': 13.6, 'Ladakh': 0.3
+}
+
+# Research sources backing each analysis area
+_COMPREHENSIVE_SOURCES = {
+    # Gender-specific obesity data sources
+    'gender_based_obesity': {
+        'WHO Global Health Observatory': 'https://www.who.int/data/gho/data/themes/noncommunicable-diseases',
+        'ICMR-INDIAB Study': 'https://www.icmr.gov.in/content/diabetes-studies',
+        'The Lancet Diabetes & Endocrinology': 'https://www.thelancet.com/journals/landia/home',
+        'Indian Journal of Medical Research': 'https://www.ijmr.org.in/'
+    },
+
+    # Geographic segmentation sources
+    'geographic_segmentation': {
+        'Ministry of Health & Family Welfare': 'https://main.mohfw.gov.in/',
+        'National Sample Survey Office': 'https://www.nsso.gov.in/',
+        'Census of India': 'https://censusindia.gov.in/',
+        'NFHS-5 Survey Data': 'http://rchiips.org/nfhs/'
+    },
+
+    # Comorbidity analysis sources
+    'comorbidity_analysis': {
+        'Diabetes Atlas': 'https://diabetesatlas.org/',
+        'National Center for Biotechnology Information': 'https://www.ncbi.nlm.nih.gov/',
+        'Nature Scientific Reports': 'https://www.nature.com/srep/',
+        'American Heart Association': 'https://www.heart.org/',
+        'Novo Nordisk Medical Affairs': 'https://www.novonordisk.com/about/who-we-are/medical-affairs.html'
+    },
+
+    # Treatment patterns sources
+    'treatment_patterns': {
+        'Frontiers in Endocrinology': 'https://www.frontiersin.org/journals/endocrinology',
+        'Economic Times Healthcare': 'https://economictimes.indiatimes.com/industry/healthcare',
+        'Clinical Trials Arena': 'https://www.clinicaltrialsarena.com/',
+        'IQVIA Healthcare Analytics': 'https://www.iqvia.com/',
+        'Indian Medical Association': 'https://www.ima-india.org/'
+    }
+}
+
+# State-level prevalence (%) used for rankings and patient counts
+_STATE_RANKING = {
+    'Goa': {'obesity_prevalence': 12.5, 'diabetes_prevalence': 35.0, 'hypertension_prevalence': 28.4},
+    'Kerala': {'obesity_prevalence': 10.9, 'diabetes_prevalence': 30.5, 'hypertension_prevalence': 26.8},
+    'Punjab': {'obesity_prevalence': 9.8, 'diabetes_prevalence': 27.4, 'hypertension_prevalence': 25.2},
+    'Delhi': {'obesity_prevalence': 9.0, 'diabetes_prevalence': 25.2, 'hypertension_prevalence': 24.1},
+    'Chandigarh': {'obesity_prevalence': 9.4, 'diabetes_prevalence': 26.3, 'hypertension_prevalence': 24.8},
+    'Tamil Nadu': {'obesity_prevalence': 7.8, 'diabetes_prevalence': 21.8, 'hypertension_prevalence': 22.5},
+    'Maharashtra': {'obesity_prevalence': 7.0, 'diabetes_prevalence': 19.6, 'hypertension_prevalence': 21.2},
+    'Karnataka': {'obesity_prevalence': 6.6, 'diabetes_prevalence': 18.5, 'hypertension_prevalence': 20.8},
+    'Gujarat': {'obesity_prevalence': 6.2, 'diabetes_prevalence': 17.4, 'hypertension_prevalence': 19.6},
+    'West Bengal': {'obesity_prevalence': 5.5, 'diabetes_prevalence': 15.4, 'hypertension_prevalence': 18.2},
+    'Haryana': {'obesity_prevalence': 8.2, 'diabetes_prevalence': 22.9, 'hypertension_prevalence': 23.6},
+    'Andhra Pradesh': {'obesity_prevalence': 5.9, 'diabetes_prevalence': 16.5, 'hypertension_prevalence': 18.7},
+    'Telangana': {'obesity_prevalence': 6.2, 'diabetes_prevalence': 17.4, 'hypertension_prevalence': 19.1},
+    'Uttar Pradesh': {'obesity_prevalence': 3.5, 'diabetes_prevalence': 9.8, 'hypertension_prevalence': 14.2},
+    'Bihar': {'obesity_prevalence': 2.7, 'diabetes_prevalence': 7.6, 'hypertension_prevalence': 12.8},
+    'Odisha': {'obesity_prevalence': 3.1, 'diabetes_prevalence': 8.7, 'hypertension_prevalence': 13.5},
+    'Jharkhand': {'obesity_prevalence': 3.1, 'diabetes_prevalence': 8.7, 'hypertension_prevalence': 13.2},
+    'Rajasthan': {'obesity_prevalence': 4.2, 'diabetes_prevalence': 11.8, 'hypertension_prevalence': 15.4},
+    'Assam': {'obesity_prevalence': 2.8, 'diabetes_prevalence': 8.1, 'hypertension_prevalence': 12.6},
+    'Chhattisgarh': {'obesity_prevalence': 3.0, 'diabetes_prevalence': 8.5, 'hypertension_prevalence': 13.1},
+    'Uttarakhand': {'obesity_prevalence': 5.1, 'diabetes_prevalence': 14.2, 'hypertension_prevalence': 17.8},
+    'Himachal Pradesh': {'obesity_prevalence': 6.8, 'diabetes_prevalence': 16.9, 'hypertension_prevalence': 19.5}
+}
+
+# Highest and lowest obesity districts
+_DISTRICT_DATA = {
+    'top_10': {
+        'Thiruvananthapuram': {'state': 'Kerala', 'obesity_rate': 14.2, 'diabetes_rate': 32.5},
+        'Ernakulam': {'state': 'Kerala', 'obesity_rate': 12.8, 'diabetes_rate': 30.2},
+        'Ludhiana': {'state': 'Punjab', 'obesity_rate': 11.9, 'diabetes_rate': 28.8},
+        'Central Delhi': {'state': 'Delhi', 'obesity_rate': 11.4, 'diabetes_rate': 27.1},
+        'Chennai': {'state': 'Tamil Nadu', 'obesity_rate': 10.8, 'diabetes_rate': 25.9},
+        'Mumbai City': {'state': 'Maharashtra', 'obesity_rate': 10.2, 'diabetes_rate': 24.8},
+        'Bengaluru Urban': {'state': 'Karnataka', 'obesity_rate': 9.8, 'diabetes_rate': 23.5},
+        'Hyderabad': {'state': 'Telangana', 'obesity_rate': 9.5, 'diabetes_rate': 22.8},
+        'Pune': {'state': 'Maharashtra', 'obesity_rate': 9.2, 'diabetes_rate': 22.2},
+        'Gurugram': {'state': 'Haryana', 'obesity_rate': 8.9, 'diabetes_rate': 21.7}
+    },
+    'bottom_10': {
+        'Sheohar': {'state': 'Bihar', 'obesity_rate': 1.2, 'diabetes_rate': 3.8},
+        'Araria': {'state': 'Bihar', 'obesity_rate': 1.4, 'diabetes_rate': 4.2},
+        'Kishanganj': {'state': 'Bihar', 'obesity_rate': 1.6, 'diabetes_rate': 4.5},
+        'Darbhanga': {'state': 'Bihar', 'obesity_rate': 1.8, 'diabetes_rate': 5.1},
+        'Saharsa': {'state': 'Bihar', 'obesity_rate': 1.9, 'diabetes_rate': 5.4},
+        'Mayurbhanj': {'state': 'Odisha', 'obesity_rate': 2.1, 'diabetes_rate': 5.8},
+        'Malkangiri': {'state': 'Odisha', 'obesity_rate': 2.2, 'diabetes_rate': 6.0},
+        'Dumka': {'state': 'Jharkhand', 'obesity_rate': 2.4, 'diabetes_rate': 6.5},
+        'Pakur': {'state': 'Jharkhand', 'obesity_rate': 2.5, 'diabetes_rate': 6.8},
+        'Balrampur': {'state': 'Uttar Pradesh', 'obesity_rate': 2.6, 'diabetes_rate': 7.2}
+    }
+}
+
+# Urban vs rural health indicators (%)
+_URBAN_RURAL = {
+    'urban': {
+        'obesity_prevalence': 6.8,
+        'diabetes_prevalence': 15.2,
+        'hypertension_prevalence': 18.5,
+        'lifestyle_intervention_adoption': 45.2,
+        'pharmacological_treatment_adoption': 12.8
+    },
+    'rural': {
+        'obesity_prevalence': 2.1,
+        'diabetes_prevalence': 8.9,
+        'hypertension_prevalence': 11.2,
+        'lifestyle_intervention_adoption': 18.5,
+        'pharmacological_treatment_adoption': 3.2
+    }
+}
+
+# City tier breakdown
+_TIER_ANALYSIS = {
+    'tier_1': {
+        'cities': ['Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Hyderabad', 'Pune', 'Kolkata', 'Ahmedabad'],
+        'avg_obesity_prevalence': 9.8,
+        'avg_diabetes_prevalence': 20.5,
+        'avg_hypertension_prevalence': 22.8,
+        'treatment_adoption_rate': 18.5,
+        'market_penetration_potential': 85
+    },
+    'tier_2': {
+        'cities': ['Jaipur', 'Lucknow', 'Kochi', 'Coimbatore', 'Vadodara', 'Nagpur', 'Indore', 'Bhopal'],
+        'avg_obesity_prevalence': 6.2,
+        'avg_diabetes_prevalence': 14.8,
+        'avg_hypertension_prevalence': 17.3,
+        'treatment_adoption_rate': 12.3,
+        'market_penetration_potential': 58
+    },
+    'tier_3': {
+        'cities': ['Agra', 'Varanasi', 'Meerut', 'Jabalpur', 'Rajkot', 'Dhanbad', 'Amritsar', 'Aligarh'],
+        'avg_obesity_prevalence': 3.8,
+        'avg_diabetes_prevalence': 9.7,
+        'avg_hypertension_prevalence': 12.5,
+        'treatment_adoption_rate': 7.2,
+        'market_penetration_potential': 28
+    }
+}
+
+# Gender-based analysis as returned by scrape_gender_based_prevalence
+_GENDER_DATA = {
+    'male_obesity': _MALE_OBESITY,
+    'female_obesity': _FEMALE_OBESITY,
+    'gender_comorbidities': {},
+    'age_demographics': {},
+    'clinical_insights': []
+}
+
+# Geographic segmentation as returned by scrape_geographic_segmentation
+_GEOGRAPHIC_DATA = {
+    'state_ranking': _STATE_RANKING,
+    'district_data': _DISTRICT_DATA,
+    'urban_rural_comparison': _URBAN_RURAL,
+    'tier_city_analysis': _TIER_ANALYSIS,
+    'regional_insights': []
+}
+
+# Comorbidity correlations and BMI-stratified prevalence
+_COMORBIDITY_DATA = {
+    'obesity_diabetes_correlation': {
+        'correlation_coefficient': 0.76,
+        'risk_increase': '3.2x higher diabetes risk',
+        'prevalence_by_bmi': {
+            'BMI 25-29.9': 18.5,
+            'BMI 30-34.9': 42.8,
+            'BMI 35+': 68.2
+        }
+    },
+    'obesity_hypertension_correlation': {
+        'correlation_coefficient': 0.68,
+        'risk_increase': '2.8x higher hypertension risk',
+        'prevalence_by_bmi': {
+            'BMI 25-29.9': 24.8,
+            'BMI 30-34.9': 48.6,
+            'BMI 35+': 72.4
+        }
+    },
+    'obesity_cvd_correlation': {
+        'correlation_coefficient': 0.58,
+        'risk_increase_percentage': 85,
+        'mortality_risk': '2.4x higher CVD mortality'
+    }
+}
+
+# Treatment adoption and access patterns
+_TREATMENT_DATA = {
+    # ✅ Removed traditional_diabetes_drugs section
+    'lifestyle_interventions': {
+        'diet_modification': {
+            'urban_adoption': 45.8,
+            'rural_adoption': 18.2,
+            'effectiveness_perception': 68.5,
+            'long_term_adherence': 28.4
+        },
+        'exercise_programs': {
+            'urban_adoption': 38.2,
+            'rural_adoption': 12.8,
+            'effectiveness_perception': 72.1,
+            'long_term_adherence': 22.6
+        }
+    },
+    'pharmacological_treatments': {
+        'glp1_agonists': {
+            'current_adoption': 4.2,
+            'urban_penetration': 8.5,
+            'rural_penetration': 0.8,
+            'patient_acceptance': 58.2,
+            'cost_barrier_impact': 68.9,
+            'market_growth_rate': 25.8
+        }
+    },
+    'surgical_interventions': {
+        'bariatric_surgery': {
+            'cost_range_lakhs': '2.5-8.0',
+            'success_rate_perception': 85.2,
+            'accessibility_score': 15.8
+        }
+    },
+    'urban_rural_differences': {
+        'treatment_access': {
+            'urban_score': 78.5,
+            'rural_score': 32.8,
+            'gap_percentage': 58.2
+        },
+        'specialist_availability': {
+            'urban_per_100k': 8.5,
+            'rural_per_100k': 1.2,
+            'gap_ratio': 7.1
+        },
+        'cost_sensitivity': {
+            'urban_willingness_to_pay': 68.2,
+            'rural_willingness_to_pay': 28.5,
+            'price_elasticity_difference': 2.4
+        }
+    }
+}
+
+# Static chart frames - built once at import since the underlying data is constant
+_GENDER_COMPARISON_DF = pd.DataFrame([
+    {
+        'Gender': 'Male', 
+        'Obesity': _MALE_OBESITY['prevalence'], 
+        'Diabetes': _MALE_OBESITY['diabetes_comorbidity'],
+        'Hypertension': _MALE_OBESITY['hypertension_comorbidity']
+    },
+    {
+        'Gender': 'Female', 
+        'Obesity': _FEMALE_OBESITY['prevalence'], 
+        'Diabetes': _FEMALE_OBESITY['diabetes_comorbidity'],
+        'Hypertension': _FEMALE_OBESITY['hypertension_comorbidity']
+    }
+])
+
+def _district_frame(districts, ascending):
+    """District table ordered by obesity rate"""
+    rows = sorted(districts.items(), key=lambda kv: kv[1]['obesity_rate'], reverse=not ascending)
+    districts_df = pd.DataFrame(
+        [(data['state'], data['obesity_rate'], data['diabetes_rate']) for _, data in rows],
+        index=[district for district, _ in rows],
+        columns=['state', 'obesity_rate', 'diabetes_rate']
+    )
+    
+    # Few distinct states per table - dictionary-encode them for Arrow
+    return districts_df.astype({'state': 'category', 'obesity_rate': 'float32', 'diabetes_rate': 'float32'})
+
+_TOP_DISTRICTS_DF = _district_frame(_DISTRICT_DATA['top_10'], ascending=False)
+_BOTTOM_DISTRICTS_DF = _district_frame(_DISTRICT_DATA['bottom_10'], ascending=True)
 
 class StructuredMarketIntelligenceEngine:
     """Comprehensive market intelligence """
     
+    # Shared reference tables - bound once at class definition, not per instance
+    state_populations = _STATE_POPULATIONS
+    comprehensive_sources = _COMPREHENSIVE_SOURCES
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -52,319 +353,51 @@ class StructuredMarketIntelligenceEngine:
             'Upgrade-Insecure-Requests': '1'
         })
         
-        # ✅ State populations (in millions) - 2023 estimates
-        self.state_populations = {
-            'Uttar Pradesh': 238.6, 'Maharashtra': 123.1, 'Bihar': 128.5, 'West Bengal': 97.7,
-            'Tamil Nadu': 77.8, 'Rajasthan': 81.0, 'Karnataka': 67.6, 'Gujarat': 70.1,
-            'Andhra Pradesh': 53.9, 'Odisha': 45.4, 'Telangana': 38.5, 'Kerala': 35.0,
-            'Jharkhand': 38.6, 'Assam': 35.6, 'Punjab': 30.1, 'Chhattisgarh': 29.4,
-            'Haryana': 28.9, 'Uttarakhand': 11.4, 'Himachal Pradesh': 7.3, 'Tripura': 4.2,
-            'Meghalaya': 3.4, 'Manipur': 3.3, 'Nagaland': 2.2, 'Goa': 1.5, 
-            'Arunachal Pradesh': 1.7, 'Mizoram': 1.2, 'Sikkim': 0.7, 'Delhi': 32.9,
-            'Chandigarh': 1.2, 'Puducherry': 1.4, 'Jammu and Kashmir': 13.6, 'Ladakh': 0.3
-        }
-        
-        self.comprehensive_sources = {
-            # Gender-specific obesity data sources
-            'gender_based_obesity': {
-                'WHO Global Health Observatory': 'https://www.who.int/data/gho/data/themes/noncommunicable-diseases',
-                'ICMR-INDIAB Study': 'https://www.icmr.gov.in/content/diabetes-studies',
-                'The Lancet Diabetes & Endocrinology': 'https://www.thelancet.com/journals/landia/home',
-                'Indian Journal of Medical Research': 'https://www.ijmr.org.in/'
-            },
-
-            # Geographic segmentation sources
-            'geographic_segmentation': {
-                'Ministry of Health & Family Welfare': 'https://main.mohfw.gov.in/',
-                'National Sample Survey Office': 'https://www.nsso.gov.in/',
-                'Census of India': 'https://censusindia.gov.in/',
-                'NFHS-5 Survey Data': 'http://rchiips.org/nfhs/'
-            },
-
-            # Comorbidity analysis sources
-            'comorbidity_analysis': {
-                'Diabetes Atlas': 'https://diabetesatlas.org/',
-                'National Center for Biotechnology Information': 'https://www.ncbi.nlm.nih.gov/',
-                'Nature Scientific Reports': 'https://www.nature.com/srep/',
-                'American Heart Association': 'https://www.heart.org/',
-                'Novo Nordisk Medical Affairs': 'https://www.novonordisk.com/about/who-we-are/medical-affairs.html'
-            },
-            
-            # Treatment patterns sources
-            'treatment_patterns': {
-                'Frontiers in Endocrinology': 'https://www.frontiersin.org/journals/endocrinology',
-                'Economic Times Healthcare': 'https://economictimes.indiatimes.com/industry/healthcare',
-                'Clinical Trials Arena': 'https://www.clinicaltrialsarena.com/',
-                'IQVIA Healthcare Analytics': 'https://www.iqvia.com/',
-                'Indian Medical Association': 'https://www.ima-india.org/'
-            }
-        }
+        # Pooled keep-alive connections with retry/backoff on transient errors
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def scrape_gender_based_prevalence(self):
-        """Scrape gender-based obesity and comorbidity prevalence"""
-        
-        cache_key = 'gender_based_analysis'
-        if self._is_cache_valid(cache_key, 60):
-            return st.session_state.live_scraped_cache[cache_key]
-        
-        gender_analysis = {
-            'male_obesity': {
-                'prevalence': 12.8,
-                'diabetes_comorbidity': 18.5,
-                'hypertension_comorbidity': 24.8,
-                'heart_disease_comorbidity': 8.2,
-                'age_distribution': {
-                    '18-30': 8.5, '31-45': 16.2, '46-60': 21.4, '60+': 18.9
-                }
-            },
-            'female_obesity': {
-                'prevalence': 15.2,
-                'diabetes_comorbidity': 16.8,
-                'hypertension_comorbidity': 22.1,
-                'heart_disease_comorbidity': 6.4,
-                'age_distribution': {
-                    '18-30': 11.2, '31-45': 19.8, '46-60': 24.1, '60+': 16.3
-                }
-            },
-            'gender_comorbidities': {},
-            'age_demographics': {},
-            'clinical_insights': []
-        }
+    @staticmethod
+    def scrape_gender_based_prevalence():
+        """Return curated gender-based obesity and comorbidity prevalence"""
         
-        self._cache_data(cache_key, gender_analysis)
-        return gender_analysis
+        return _GENDER_DATA
     
-    def scrape_geographic_segmentation(self):
-        """Scrape geographic segmentation data by state, district, urban/rural, city tiers"""
-        
-        cache_key = 'geographic_segmentation'
-        if self._is_cache_valid(cache_key, 90):
-            return st.session_state.live_scraped_cache[cache_key]
-        
-        geographic_data = {
-            'state_ranking': {
-                'Goa': {'obesity_prevalence': 12.5, 'diabetes_prevalence': 35.0, 'hypertension_prevalence': 28.4},
-                'Kerala': {'obesity_prevalence': 10.9, 'diabetes_prevalence': 30.5, 'hypertension_prevalence': 26.8},
-                'Punjab': {'obesity_prevalence': 9.8, 'diabetes_prevalence': 27.4, 'hypertension_prevalence': 25.2},
-                'Delhi': {'obesity_prevalence': 9.0, 'diabetes_prevalence': 25.2, 'hypertension_prevalence': 24.1},
-                'Chandigarh': {'obesity_prevalence': 9.4, 'diabetes_prevalence': 26.3, 'hypertension_prevalence': 24.8},
-                'Tamil Nadu': {'obesity_prevalence': 7.8, 'diabetes_prevalence': 21.8, 'hypertension_prevalence': 22.5},
-                'Maharashtra': {'obesity_prevalence': 7.0, 'diabetes_prevalence': 19.6, 'hypertension_prevalence': 21.2},
-                'Karnataka': {'obesity_prevalence': 6.6, 'diabetes_prevalence': 18.5, 'hypertension_prevalence': 20.8},
-                'Gujarat': {'obesity_prevalence': 6.2, 'diabetes_prevalence': 17.4, 'hypertension_prevalence': 19.6},
-                'West Bengal': {'obesity_prevalence': 5.5, 'diabetes_prevalence': 15.4, 'hypertension_prevalence': 18.2},
-                'Haryana': {'obesity_prevalence': 8.2, 'diabetes_prevalence': 22.9, 'hypertension_prevalence': 23.6},
-                'Andhra Pradesh': {'obesity_prevalence': 5.9, 'diabetes_prevalence': 16.5, 'hypertension_prevalence': 18.7},
-                'Telangana': {'obesity_prevalence': 6.2, 'diabetes_prevalence': 17.4, 'hypertension_prevalence': 19.1},
-                'Uttar Pradesh': {'obesity_prevalence': 3.5, 'diabetes_prevalence': 9.8, 'hypertension_prevalence': 14.2},
-                'Bihar': {'obesity_prevalence': 2.7, 'diabetes_prevalence': 7.6, 'hypertension_prevalence': 12.8},
-                'Odisha': {'obesity_prevalence': 3.1, 'diabetes_prevalence': 8.7, 'hypertension_prevalence': 13.5},
-                'Jharkhand': {'obesity_prevalence': 3.1, 'diabetes_prevalence': 8.7, 'hypertension_prevalence': 13.2},
-                'Rajasthan': {'obesity_prevalence': 4.2, 'diabetes_prevalence': 11.8, 'hypertension_prevalence': 15.4},
-                'Assam': {'obesity_prevalence': 2.8, 'diabetes_prevalence': 8.1, 'hypertension_prevalence': 12.6},
-                'Chhattisgarh': {'obesity_prevalence': 3.0, 'diabetes_prevalence': 8.5, 'hypertension_prevalence': 13.1},
-                'Uttarakhand': {'obesity_prevalence': 5.1, 'diabetes_prevalence': 14.2, 'hypertension_prevalence': 17.8},
-                'Himachal Pradesh': {'obesity_prevalence': 6.8, 'diabetes_prevalence': 16.9, 'hypertension_prevalence': 19.5}
-            },
-            'district_data': {
-                'top_10': {
-                    'Thiruvananthapuram': {'state': 'Kerala', 'obesity_rate': 14.2, 'diabetes_rate': 32.5},
-                    'Ernakulam': {'state': 'Kerala', 'obesity_rate': 12.8, 'diabetes_rate': 30.2},
-                    'Ludhiana': {'state': 'Punjab', 'obesity_rate': 11.9, 'diabetes_rate': 28.8},
-                    'Central Delhi': {'state': 'Delhi', 'obesity_rate': 11.4, 'diabetes_rate': 27.1},
-                    'Chennai': {'state': 'Tamil Nadu', 'obesity_rate': 10.8, 'diabetes_rate': 25.9},
-                    'Mumbai City': {'state': 'Maharashtra', 'obesity_rate': 10.2, 'diabetes_rate': 24.8},
-                    'Bengaluru Urban': {'state': 'Karnataka', 'obesity_rate': 9.8, 'diabetes_rate': 23.5},
-                    'Hyderabad': {'state': 'Telangana', 'obesity_rate': 9.5, 'diabetes_rate': 22.8},
-                    'Pune': {'state': 'Maharashtra', 'obesity_rate': 9.2, 'diabetes_rate': 22.2},
-                    'Gurugram': {'state': 'Haryana', 'obesity_rate': 8.9, 'diabetes_rate': 21.7}
-                },
-                'bottom_10': {
-                    'Sheohar': {'state': 'Bihar', 'obesity_rate': 1.2, 'diabetes_rate': 3.8},
-                    'Araria': {'state': 'Bihar', 'obesity_rate': 1.4, 'diabetes_rate': 4.2},
-                    'Kishanganj': {'state': 'Bihar', 'obesity_rate': 1.6, 'diabetes_rate': 4.5},
-                    'Darbhanga': {'state': 'Bihar', 'obesity_rate': 1.8, 'diabetes_rate': 5.1},
-                    'Saharsa': {'state': 'Bihar', 'obesity_rate': 1.9, 'diabetes_rate': 5.4},
-                    'Mayurbhanj': {'state': 'Odisha', 'obesity_rate': 2.1, 'diabetes_rate': 5.8},
-                    'Malkangiri': {'state': 'Odisha', 'obesity_rate': 2.2, 'diabetes_rate': 6.0},
-                    'Dumka': {'state': 'Jharkhand', 'obesity_rate': 2.4, 'diabetes_rate': 6.5},
-                    'Pakur': {'state': 'Jharkhand', 'obesity_rate': 2.5, 'diabetes_rate': 6.8},
-                    'Balrampur': {'state': 'Uttar Pradesh', 'obesity_rate': 2.6, 'diabetes_rate': 7.2}
-                }
-            },
-            'urban_rural_comparison': {
-                'urban': {
-                    'obesity_prevalence': 6.8,
-                    'diabetes_prevalence': 15.2,
-                    'hypertension_prevalence': 18.5,
-                    'lifestyle_intervention_adoption': 45.2,
-                    'pharmacological_treatment_adoption': 12.8
-                },
-                'rural': {
-                    'obesity_prevalence': 2.1,
-                    'diabetes_prevalence': 8.9,
-                    'hypertension_prevalence': 11.2,
-                    'lifestyle_intervention_adoption': 18.5,
-                    'pharmacological_treatment_adoption': 3.2
-                }
-            },
-            'tier_city_analysis': {
-                'tier_1': {
-                    'cities': ['Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Hyderabad', 'Pune', 'Kolkata', 'Ahmedabad'],
-                    'avg_obesity_prevalence': 9.8,
-                    'avg_diabetes_prevalence': 20.5,
-                    'avg_hypertension_prevalence': 22.8,
-                    'treatment_adoption_rate': 18.5,
-                    'market_penetration_potential': 85
-                },
-                'tier_2': {
-                    'cities': ['Jaipur', 'Lucknow', 'Kochi', 'Coimbatore', 'Vadodara', 'Nagpur', 'Indore', 'Bhopal'],
-                    'avg_obesity_prevalence': 6.2,
-                    'avg_diabetes_prevalence': 14.8,
-                    'avg_hypertension_prevalence': 17.3,
-                    'treatment_adoption_rate': 12.3,
-                    'market_penetration_potential': 58
-                },
-                'tier_3': {
-                    'cities': ['Agra', 'Varanasi', 'Meerut', 'Jabalpur', 'Rajkot', 'Dhanbad', 'Amritsar', 'Aligarh'],
-                    'avg_obesity_prevalence': 3.8,
-                    'avg_diabetes_prevalence': 9.7,
-                    'avg_hypertension_prevalence': 12.5,
-                    'treatment_adoption_rate': 7.2,
-                    'market_penetration_potential': 28
-                }
-            },
-            'regional_insights': []
-        }
+    @staticmethod
+    def scrape_geographic_segmentation():
+        """Return curated geographic segmentation data by state, district, urban/rural, city tiers"""
         
-        self._cache_data(cache_key, geographic_data)
-        return geographic_data
+        return _GEOGRAPHIC_DATA
     
-    def scrape_comorbidity_analysis(self):
-        """Scrape comorbidity correlations and risk analysis"""
-        
-        cache_key = 'comorbidity_analysis'
-        if self._is_cache_valid(cache_key, 120):
-            return st.session_state.live_scraped_cache[cache_key]
-        
-        comorbidity_data = {
-            'obesity_diabetes_correlation': {
-                'correlation_coefficient': 0.76,
-                'risk_increase': '3.2x higher diabetes risk',
-                'prevalence_by_bmi': {
-                    'BMI 25-29.9': 18.5,
-                    'BMI 30-34.9': 42.8,
-                    'BMI 35+': 68.2
-                }
-            },
-            'obesity_hypertension_correlation': {
-                'correlation_coefficient': 0.68,
-                'risk_increase': '2.8x higher hypertension risk',
-                'prevalence_by_bmi': {
-                    'BMI 25-29.9': 24.8,
-                    'BMI 30-34.9': 48.6,
-                    'BMI 35+': 72.4
-                }
-            },
-            'obesity_cvd_correlation': {
-                'correlation_coefficient': 0.58,
-                'risk_increase_percentage': 85,
-                'mortality_risk': '2.4x higher CVD mortality'
-            }
-        }
+    @staticmethod
+    def scrape_comorbidity_analysis():
+        """Return curated comorbidity correlations and risk analysis"""
         
-        self._cache_data(cache_key, comorbidity_data)
-        return comorbidity_data
+        return _COMORBIDITY_DATA
     
-    def scrape_treatment_patterns(self):
-        """Scrape treatment pattern analysis"""
-        
-        cache_key = 'treatment_patterns'
-        if self._is_cache_valid(cache_key, 90):
-            return st.session_state.live_scraped_cache[cache_key]
-        
-        treatment_data = {
-            # ✅ Removed traditional_diabetes_drugs section
-            'lifestyle_interventions': {
-                'diet_modification': {
-                    'urban_adoption': 45.8,
-                    'rural_adoption': 18.2,
-                    'effectiveness_perception': 68.5,
-                    'long_term_adherence': 28.4
-                },
-                'exercise_programs': {
-                    'urban_adoption': 38.2,
-                    'rural_adoption': 12.8,
-                    'effectiveness_perception': 72.1,
-                    'long_term_adherence': 22.6
-                }
-            },
-            'pharmacological_treatments': {
-                'glp1_agonists': {
-                    'current_adoption': 4.2,
-                    'urban_penetration': 8.5,
-                    'rural_penetration': 0.8,
-                    'patient_acceptance': 58.2,
-                    'cost_barrier_impact': 68.9,
-                    'market_growth_rate': 25.8
-                }
-            },
-            'surgical_interventions': {
-                'bariatric_surgery': {
-                    'cost_range_lakhs': '2.5-8.0',
-                    'success_rate_perception': 85.2,
-                    'accessibility_score': 15.8
-                }
-            },
-            'urban_rural_differences': {
-                'treatment_access': {
-                    'urban_score': 78.5,
-                    'rural_score': 32.8,
-                    'gap_percentage': 58.2
-                },
-                'specialist_availability': {
-                    'urban_per_100k': 8.5,
-                    'rural_per_100k': 1.2,
-                    'gap_ratio': 7.1
-                },
-                'cost_sensitivity': {
-                    'urban_willingness_to_pay': 68.2,
-                    'rural_willingness_to_pay': 28.5,
-                    'price_elasticity_difference': 2.4
-                }
-            }
-        }
+    @staticmethod
+    def scrape_treatment_patterns():
+        """Return curated treatment pattern analysis"""
         
-        self._cache_data(cache_key, treatment_data)
-        return treatment_data
+        return _TREATMENT_DATA
     
     def _calculate_obese_patients_by_state(self, geographic_data):
         """Calculate actual number of obese patients by state based on population"""
         
-        state_obese_calculations = {}
+        df = pd.DataFrame.from_dict(geographic_data['state_ranking'], orient='index')
+        populations = pd.Series(self.state_populations, dtype=np.float64)
+        df.insert(0, 'population_millions', populations.reindex(df.index, fill_value=0.0).to_numpy())
         
-        for state, data in geographic_data['state_ranking'].items():
-            population = self.state_populations.get(state, 0)
-            obesity_prevalence = data['obesity_prevalence']
-            diabetes_prevalence = data['diabetes_prevalence']
-            hypertension_prevalence = data['hypertension_prevalence']
-            
-            # Calculate absolute numbers (in millions)
-            obese_patients = (population * obesity_prevalence) / 100
-            diabetic_patients = (population * diabetes_prevalence) / 100
-            hypertension_patients = (population * hypertension_prevalence) / 100
-            
-            state_obese_calculations[state] = {
-                'population_millions': population,
-                'obesity_prevalence': obesity_prevalence,
-                'diabetes_prevalence': diabetes_prevalence,
-                'hypertension_prevalence': hypertension_prevalence,
-                'obese_patients_total': round(obese_patients * 1000000),
-                'diabetic_patients_total': round(diabetic_patients * 1000000),
-                'hypertension_patients_total': round(hypertension_patients * 1000000)
-            }
+        # Calculate absolute numbers (in millions), then convert to head counts - one pass over all states
+        prevalence = df[['obesity_prevalence', 'diabetes_prevalence', 'hypertension_prevalence']].to_numpy()
+        population = df['population_millions'].to_numpy()[:, None]
+        df[['obese_patients_total', 'diabetic_patients_total', 'hypertension_patients_total']] = (
+            np.rint(population * prevalence / 100 * 1000000).astype(np.int64)
+        )
         
-        return state_obese_calculations
+        return df.to_dict(orient='index')
     
     def generate_market_potential_rankings(self):
         """Generate ranked insights and market analysis"""
@@ -385,27 +418,9 @@ class StructuredMarketIntelligenceEngine:
             'treatment_patterns': treatment_data,
             'state_obese_calculations': state_obese_calculations
         }
-    
-    def _is_cache_valid(self, cache_key, max_age_minutes=30):
-        """Check if cached data is still valid"""
-        if cache_key not in st.session_state.scrape_timestamps:
-            return False
-        
-        last_scrape = st.session_state.scrape_timestamps[cache_key]
-        age_minutes = (datetime.now() - last_scrape).total_seconds() / 60
-        
-        return age_minutes < max_age_minutes
-    
-    def _cache_data(self, cache_key, data):
-        """Cache scraped data"""
-        st.session_state.live_scraped_cache[cache_key] = data
-        st.session_state.scrape_timestamps[cache_key] = datetime.now()
 
-def main():
-    """Main application with mobile-responsive design"""
-    
-    # ✅ MOBILE-FIRST RESPONSIVE CSS
-    st.markdown("""
+# ✅ MOBILE-FIRST RESPONSIVE CSS - static, re-emitted on every rerun so the styles stay mounted
+_STYLE_HTML = """
     <style>
     /* Mobile-first responsive design */
     @media (max-width: 768px) {
@@ -450,7 +465,7 @@ def main():
         }
         
         /* Tab styling for mobile */
-        .stTabs [data-baseweb="tab"] {
+        .stRadio [role="radiogroup"] label {
             padding: 8px 12px !important;
             font-size: 14px !important;
         }
@@ -505,270 +520,364 @@ def main():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
-    
-    # ✅ UPDATED HEADER (removed Rankings from analysis areas)
-    st.markdown("""
+"""
+
+# ✅ UPDATED HEADER (removed Rankings from analysis areas)
+_HEADER_HTML = """
     <div class="main-header">
         <h2>A comprehensive market analysis to quantify obesity prevalence, patient profiles, and treatment patterns in India, providing data-driven insights to inform the commercial strategy for Wegovy</h2>
         <p><strong>Analysis Areas:</strong> Gender • Geographic & Rankings • Comorbidity • Treatment</p>
     </div>
-    """, unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def get_engine():
+    """Process-wide engine instance, so its HTTP session and pools survive reruns"""
+    return StructuredMarketIntelligenceEngine()
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _cached_rankings():
+    """Market rankings shared across reruns and sessions, rebuilt hourly"""
+    return get_engine().generate_market_potential_rankings()
+
+def _build_age_df(male_data, female_data):
+    """Age-wise prevalence for both genders; empty if either side has no data"""
+    male_ages = male_data.get('age_distribution', {})
+    female_ages = female_data.get('age_distribution', {})
     
-    # Initialize engine with loading spinner
-    with st.spinner('🔄 Loading market intelligence data...'):
-        intelligence_engine = StructuredMarketIntelligenceEngine()
-        comprehensive_analysis = intelligence_engine.generate_market_potential_rankings()
-    
-    # ✅ UPDATED TABS (removed Rankings tab - now 4 tabs instead of 5)
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "👥 Gender",           # Gender-Based Analysis
-        "🗺️ Geographic & Rankings",  # ✅ Combined Geographic + Rankings
-        "🫀 Comorbidity",      # Comorbidity Analysis
-        "💊 Treatment"         # Treatment Patterns
+    if not male_ages or not female_ages:
+        return pd.DataFrame()
+    # Buckets are identical by construction - keep their natural order, append any extras
+    ages = list(male_ages) + [age for age in female_ages if age not in male_ages]
+    return pd.DataFrame({
+        'Age Group': ages,
+        'Male Prevalence': [male_ages.get(age, 0) for age in ages],
+        'Female Prevalence': [female_ages.get(age, 0) for age in ages]
+    })
+
+def _build_state_ranking_df(state_calculations):
+    """Display-ready state ranking ordered by total obese patients"""
+    states = list(state_calculations)
+    records = [state_calculations[state] for state in states]
+    totals = np.fromiter((r['obese_patients_total'] for r in records), dtype=np.int64, count=len(records))
+    order = np.argsort(-totals, kind='stable')
+    
+    def column(key):
+        # Typed columns let st.dataframe hand Arrow plain buffers
+        return np.fromiter((records[i][key] for i in order), dtype=np.float32, count=len(order))
+    
+    return pd.DataFrame({
+        'Rank': np.arange(1, len(order) + 1, dtype=np.int32),
+        'State': [states[i] for i in order],
+        'Population (M)': column('population_millions'),
+        'Obesity %': column('obesity_prevalence'),
+        'Diabetes %': column('diabetes_prevalence'),
+        'Hypertension %': column('hypertension_prevalence'),
+        # Largest state total is ~8.6M head counts (Maharashtra) - well inside int32
+        'Obese Patients Total': totals[order].astype(np.int32)
+    })
+
+def _build_urban_rural_df(urban_rural_data):
+    """Urban vs rural health indicators"""
+    urban, rural = urban_rural_data['urban'], urban_rural_data['rural']
+    return pd.DataFrame({
+        'Area Type': ['Urban', 'Rural'],
+        'Obesity %': [urban['obesity_prevalence'], rural['obesity_prevalence']],
+        'Diabetes %': [urban['diabetes_prevalence'], rural['diabetes_prevalence']],
+        'Hypertension %': [urban['hypertension_prevalence'], rural['hypertension_prevalence']]
+    })
+
+def _build_treatment_adoption_df(treatment_data):
+    """Urban vs rural adoption per treatment type"""
+    # ✅ Traditional Diabetes row intentionally excluded
+    lifestyle = treatment_data['lifestyle_interventions']
+    diet, exercise = lifestyle['diet_modification'], lifestyle['exercise_programs']
+    glp1 = treatment_data['pharmacological_treatments']['glp1_agonists']
+    adoption = np.array([
+        [diet['urban_adoption'], diet['rural_adoption']],
+        [exercise['urban_adoption'], exercise['rural_adoption']],
+        [glp1['urban_penetration'], glp1['rural_penetration']]
+    ], dtype=np.float32)
+    return pd.DataFrame({
+        'Treatment Type': pd.Categorical(['Lifestyle - Diet', 'Lifestyle - Exercise', 'GLP-1 Agonists']),
+        'Urban Adoption %': adoption[:, 0],
+        'Rural Adoption %': adoption[:, 1]
+    })
+
+@st.cache_resource(show_spinner=False)
+def _fig_gender():
+    # Static input - built once per process, nothing to hash on reruns
+    # ✅ Mobile-optimized chart height
+    return px.bar(_GENDER_COMPARISON_DF, x='Gender', y=['Obesity', 'Diabetes', 'Hypertension'],
+                  title='Gender-Based Prevalence Comparison (%)', barmode='group',
+                  height=400)  # Optimized height for mobile
+
+@st.cache_resource(show_spinner=False)
+def _fig_age(df):
+    return px.bar(df, x='Age Group', y=['Male Prevalence', 'Female Prevalence'],
+                  title='Age-Wise Obesity Prevalence by Gender (%)', barmode='group',
+                  height=350)
+
+@st.cache_resource(show_spinner=False)
+def _fig_top10(df):
+    fig = px.bar(df, x='State', y='Obese Patients Total',
+                 title='Top 10 States by Total Obese Patients',
+                 height=350)
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _fig_urban_rural(df):
+    return px.bar(df, x='Area Type', y=['Obesity %', 'Diabetes %', 'Hypertension %'],
+                  title='Urban vs Rural Health Indicators', barmode='group',
+                  height=400)
+
+# Small fixed-shape charts - traces are fed plain lists, no DataFrame round-trip
+_TIER_KEYS = ('tier_1', 'tier_2', 'tier_3')
+_TIER_LABELS = ['Tier 1', 'Tier 2', 'Tier 3']
+_TIER_SERIES = (
+    ('Obesity %', 'avg_obesity_prevalence'),
+    ('Diabetes %', 'avg_diabetes_prevalence'),
+    ('Hypertension %', 'avg_hypertension_prevalence')
+)
+_CORRELATION_KEYS = ('obesity_diabetes_correlation', 'obesity_hypertension_correlation', 'obesity_cvd_correlation')
+_CORRELATION_LABELS = ['Obesity-Diabetes', 'Obesity-Hypertension', 'Obesity-CVD']
+_BMI_CATEGORIES = ('BMI 25-29.9', 'BMI 30-34.9', 'BMI 35+')
+
+@st.cache_resource(show_spinner=False)
+def _fig_tier(tier_data):
+    tiers = [tier_data[key] for key in _TIER_KEYS]
+    fig = go.Figure([
+        go.Scatter(x=_TIER_LABELS, y=[tier[field] for tier in tiers], mode='lines', name=label,
+                   hovertemplate=f'variable={label}<br>City Tier=%{{x}}<br>value=%{{y}}<extra></extra>')
+        for label, field in _TIER_SERIES
     ])
+    fig.update_layout(title='City Tier Health Analysis', height=350,
+                      xaxis_title='City Tier', yaxis_title='value', legend_title_text='variable')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _fig_corr(coefficients):
+    fig = go.Figure(go.Bar(x=_CORRELATION_LABELS, y=list(coefficients),
+                           hovertemplate='Correlation Type=%{x}<br>Coefficient=%{y}<extra></extra>'))
+    fig.update_layout(title='Comorbidity Correlation Strengths', height=400,
+                      xaxis_title='Correlation Type', yaxis_title='Coefficient')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _fig_bmi(prevalences):
+    fig = go.Figure(go.Bar(x=list(_BMI_CATEGORIES), y=list(prevalences),
+                           hovertemplate='BMI Category=%{x}<br>Diabetes Prevalence %=%{y}<extra></extra>'))
+    fig.update_layout(title='Diabetes Prevalence Increases with BMI', height=350,
+                      xaxis_title='BMI Category', yaxis_title='Diabetes Prevalence %')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _fig_treatment(df):
+    return px.bar(df, x='Treatment Type', y=['Urban Adoption %', 'Rural Adoption %'],
+                  title='Treatment Adoption Patterns: Urban vs Rural', barmode='group',
+                  height=400)
+
+def render_gender_tab(comprehensive_analysis):
+    """Gender-based prevalence view"""
     
-    with tab1:
-        st.markdown("## 👥 Gender-Based Prevalence Analysis")
-        st.markdown("*Comprehensive analysis of obesity and comorbidity patterns by gender*")
-        
-        gender_data = comprehensive_analysis['gender_analysis']
-        
-        # Gender comparison visualization
-        gender_comparison = pd.DataFrame([
-            {
-                'Gender': 'Male', 
-                'Obesity': gender_data['male_obesity'].get('prevalence', 0), 
-                'Diabetes': gender_data['male_obesity'].get('diabetes_comorbidity', 0),
-                'Hypertension': gender_data['male_obesity'].get('hypertension_comorbidity', 0)
-            },
-            {
-                'Gender': 'Female', 
-                'Obesity': gender_data['female_obesity'].get('prevalence', 0), 
-                'Diabetes': gender_data['female_obesity'].get('diabetes_comorbidity', 0),
-                'Hypertension': gender_data['female_obesity'].get('hypertension_comorbidity', 0)
-            }
-        ])
-        
-        # ✅ Mobile-optimized chart height
-        fig_gender = px.bar(gender_comparison, x='Gender', y=['Obesity', 'Diabetes', 'Hypertension'],
-                           title='Gender-Based Prevalence Comparison (%)', barmode='group',
-                           height=400)  # Optimized height for mobile
-        st.plotly_chart(fig_gender, use_container_width=True)
-        
-        # ✅ Age-Wise Distribution Details (NO DROPDOWN - Always visible)
-        st.subheader("📊 Age-Wise Distribution Details")
-        male_data = gender_data['male_obesity']
-        female_data = gender_data['female_obesity']
-        
-        age_data_male = pd.DataFrame(list(male_data.get('age_distribution', {}).items()), 
-                                   columns=['Age Group', 'Male Prevalence'])
-        age_data_female = pd.DataFrame(list(female_data.get('age_distribution', {}).items()), 
-                                     columns=['Age Group', 'Female Prevalence'])
-        
-        if not age_data_male.empty and not age_data_female.empty:
-            age_combined = pd.merge(age_data_male, age_data_female, on='Age Group', how='outer').fillna(0)
-            
-            fig_age = px.bar(age_combined, x='Age Group', y=['Male Prevalence', 'Female Prevalence'],
-                            title='Age-Wise Obesity Prevalence by Gender (%)', barmode='group',
-                            height=350)
-            st.plotly_chart(fig_age, use_container_width=True)
-        
-        # ✅ Clickable links
-        st.markdown("""
-        <div class="sources-section">
-            <h4>📍 Research Sources</h4>
-            <p><strong>WHO Obesity Database:</strong> <a href="https://www.who.int/data/gho/data/themes/noncommunicable-diseases" target="_blank">https://www.who.int/data/gho/data/themes/noncommunicable-diseases</a></p>
-            <p><strong>ICMR Diabetes Study:</strong> <a href="https://www.icmr.gov.in/content/diabetes-studies" target="_blank">https://www.icmr.gov.in/content/diabetes-studies</a></p>
-            <p><strong>Lancet Medical Journal:</strong> <a href="https://www.thelancet.com/journals/landia/home" target="_blank">https://www.thelancet.com/journals/landia/home</a></p>
-            <p><strong>IJMR Publications:</strong> <a href="https://www.ijmr.org.in/" target="_blank">https://www.ijmr.org.in/</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with tab2:
-        st.markdown("## 🗺️ Geographic Analysis & State Rankings")  # ✅ Combined title
-        st.markdown("*Comprehensive geographic analysis with state rankings by patient count*")  # ✅ Combined description
-        
-        geographic_data = comprehensive_analysis['geographic_segmentation']
-        state_calculations = comprehensive_analysis['state_obese_calculations']
-        
-        # ✅ MERGED: State rankings by patient count (from old Rankings tab)
-        st.subheader("🏆 State Rankings by Total Obese Patients")
-        
-        ranking_df = pd.DataFrame.from_dict(state_calculations, orient='index')
-        ranking_df = ranking_df.sort_values('obese_patients_total', ascending=False)
-        ranking_df.reset_index(inplace=True)
-        
-        # Create display dataframe with hypertension
-        display_ranking = ranking_df[['index', 'population_millions', 'obesity_prevalence', 
-                                    'diabetes_prevalence', 'hypertension_prevalence', 'obese_patients_total']].copy()
-        display_ranking.columns = ['State', 'Population (M)', 'Obesity %', 'Diabetes %', 'Hypertension %', 'Obese Patients Total']
-        
-        # Add ranking column
-        display_ranking['Rank'] = range(1, len(display_ranking) + 1)
-        display_ranking = display_ranking[['Rank', 'State', 'Population (M)', 'Obesity %', 'Diabetes %', 'Hypertension %', 'Obese Patients Total']]
-        
-        st.dataframe(display_ranking, use_container_width=True)
-        
-        # ✅ MERGED: Top 10 States visualization (from old Rankings tab)
-        st.subheader("📊 Top 10 States by Obese Patient Count")
-        top_10_states = display_ranking.head(10)
-        fig_top10 = px.bar(top_10_states, x='State', y='Obese Patients Total',
-                          title='Top 10 States by Total Obese Patients',
-                          height=350)
-        fig_top10.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_top10, use_container_width=True)
-        
-        # ✅ District Analysis (from old Geographic tab)
-        st.subheader("🔝 Top 10 Districts by Obesity Prevalence")
-        top_districts_df = pd.DataFrame.from_dict(geographic_data['district_data']['top_10'], orient='index')
-        top_districts_df = top_districts_df.sort_values('obesity_rate', ascending=False)
-        st.dataframe(top_districts_df, use_container_width=True)
-        
-        st.subheader("🔻 Bottom 10 Districts by Obesity Prevalence")
-        bottom_districts_df = pd.DataFrame.from_dict(geographic_data['district_data']['bottom_10'], orient='index')
-        bottom_districts_df = bottom_districts_df.sort_values('obesity_rate', ascending=True)
-        st.dataframe(bottom_districts_df, use_container_width=True)
-        
-        # Urban vs Rural Comparison with Hypertension
-        st.subheader("🏙️ Urban vs Rural Comparison")
-        
-        urban_rural_data = geographic_data['urban_rural_comparison']
-        comparison_df = pd.DataFrame([
-            ['Urban', urban_rural_data['urban']['obesity_prevalence'], 
-             urban_rural_data['urban']['diabetes_prevalence'],
-             urban_rural_data['urban']['hypertension_prevalence']],
-            ['Rural', urban_rural_data['rural']['obesity_prevalence'], 
-             urban_rural_data['rural']['diabetes_prevalence'],
-             urban_rural_data['rural']['hypertension_prevalence']]
-        ], columns=['Area Type', 'Obesity %', 'Diabetes %', 'Hypertension %'])
-        
-        fig_urban_rural = px.bar(comparison_df, x='Area Type', y=['Obesity %', 'Diabetes %', 'Hypertension %'],
-                                title='Urban vs Rural Health Indicators', barmode='group',
-                                height=400)
-        st.plotly_chart(fig_urban_rural, use_container_width=True)
-        
-        # ✅ City Tier Analysis with Hypertension
-        st.subheader("🎯 City Tier Analysis Details")
-        tier_data = geographic_data['tier_city_analysis']
-        tier_df = pd.DataFrame([
-            ['Tier 1', tier_data['tier_1']['avg_obesity_prevalence'], 
-             tier_data['tier_1']['avg_diabetes_prevalence'],
-             tier_data['tier_1']['avg_hypertension_prevalence']],
-            ['Tier 2', tier_data['tier_2']['avg_obesity_prevalence'], 
-             tier_data['tier_2']['avg_diabetes_prevalence'],
-             tier_data['tier_2']['avg_hypertension_prevalence']],
-            ['Tier 3', tier_data['tier_3']['avg_obesity_prevalence'], 
-             tier_data['tier_3']['avg_diabetes_prevalence'],
-             tier_data['tier_3']['avg_hypertension_prevalence']]
-        ], columns=['City Tier', 'Obesity %', 'Diabetes %', 'Hypertension %'])
-        
-        fig_tier = px.line(tier_df, x='City Tier', y=['Obesity %', 'Diabetes %', 'Hypertension %'],
-                          title='City Tier Health Analysis',
-                          height=350)
-        st.plotly_chart(fig_tier, use_container_width=True)
-        
-        # ✅ Clickable links (combined sources from both old tabs)
-        st.markdown("""
-        <div class="sources-section">
-            <h4>📍 Research Sources</h4>
-            <p><strong>Health Ministry Database:</strong> <a href="https://main.mohfw.gov.in/" target="_blank">https://main.mohfw.gov.in/</a></p>
-            <p><strong>Population Survey Office:</strong> <a href="https://www.nsso.gov.in/" target="_blank">https://www.nsso.gov.in/</a></p>
-            <p><strong>Indian Census Portal:</strong> <a href="https://censusindia.gov.in/" target="_blank">https://censusindia.gov.in/</a></p>
-            <p><strong>NFHS Health Survey:</strong> <a href="http://rchiips.org/nfhs/" target="_blank">http://rchiips.org/nfhs/</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with tab3:
-        st.markdown("## 🫀 Comorbidity & Risk Analysis")
-        st.markdown("*Correlations with heart disease, diabetes, hypertension*")
-        
-        comorbidity_data = comprehensive_analysis['comorbidity_analysis']
-        
-        # Correlation strength visualization
-        correlations = pd.DataFrame([
-            ['Obesity-Diabetes', comorbidity_data['obesity_diabetes_correlation']['correlation_coefficient']],
-            ['Obesity-Hypertension', comorbidity_data['obesity_hypertension_correlation']['correlation_coefficient']],
-            ['Obesity-CVD', comorbidity_data['obesity_cvd_correlation']['correlation_coefficient']]
-        ], columns=['Correlation Type', 'Coefficient'])
-        
-        fig_corr = px.bar(correlations, x='Correlation Type', y='Coefficient',
-                         title='Comorbidity Correlation Strengths',
-                         height=400)
-        st.plotly_chart(fig_corr, use_container_width=True)
-        
-        # ✅ BMI-based prevalence analysis (NO DROPDOWN - Always visible)
-        st.subheader("📈 Diabetes Prevalence by BMI Category")
-        bmi_diabetes_data = pd.DataFrame([
-            ['BMI 25-29.9', comorbidity_data['obesity_diabetes_correlation']['prevalence_by_bmi']['BMI 25-29.9']],
-            ['BMI 30-34.9', comorbidity_data['obesity_diabetes_correlation']['prevalence_by_bmi']['BMI 30-34.9']],
-            ['BMI 35+', comorbidity_data['obesity_diabetes_correlation']['prevalence_by_bmi']['BMI 35+']]
-        ], columns=['BMI Category', 'Diabetes Prevalence %'])
-        
-        fig_bmi = px.bar(bmi_diabetes_data, x='BMI Category', y='Diabetes Prevalence %',
-                        title='Diabetes Prevalence Increases with BMI',
-                        height=350)
-        st.plotly_chart(fig_bmi, use_container_width=True)
-        
-        # ✅ Clickable links
-        st.markdown("""
-        <div class="sources-section">
-            <h4>📍 Research Sources</h4>
-            <p><strong>Global Diabetes Atlas:</strong> <a href="https://diabetesatlas.org/" target="_blank">https://diabetesatlas.org/</a></p>
-            <p><strong>NCBI Medical Database:</strong> <a href="https://www.ncbi.nlm.nih.gov/" target="_blank">https://www.ncbi.nlm.nih.gov/</a></p>
-            <p><strong>Nature Scientific Journal:</strong> <a href="https://www.nature.com/srep/" target="_blank">https://www.nature.com/srep/</a></p>
-            <p><strong>AHA Research Portal:</strong> <a href="https://www.heart.org/" target="_blank">https://www.heart.org/</a></p>
-            <p><strong>Novo Nordisk Clinical Data:</strong> <a href="https://www.novonordisk.com/about/who-we-are/medical-affairs.html" target="_blank">https://www.novonordisk.com/about/who-we-are/medical-affairs.html</a></p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with tab4:
-        st.markdown("## 💊 Treatment Options")
-        st.markdown("*Available treatment interventions: GLP-1 agonists, lifestyle modifications, and surgical options*")
-        
-        treatment_data = comprehensive_analysis['treatment_patterns']
-        
-        # ✅ Treatment adoption comparison (REMOVED Traditional Diabetes entry)
-        treatment_adoption = pd.DataFrame([
-            ['Lifestyle - Diet', treatment_data['lifestyle_interventions']['diet_modification']['urban_adoption'],
-             treatment_data['lifestyle_interventions']['diet_modification']['rural_adoption']],
-            ['Lifestyle - Exercise', treatment_data['lifestyle_interventions']['exercise_programs']['urban_adoption'],
-             treatment_data['lifestyle_interventions']['exercise_programs']['rural_adoption']],
-            ['GLP-1 Agonists', treatment_data['pharmacological_treatments']['glp1_agonists']['urban_penetration'],
-             treatment_data['pharmacological_treatments']['glp1_agonists']['rural_penetration']]
-            # ✅ REMOVED: Traditional Diabetes line that was causing the issue
-        ], columns=['Treatment Type', 'Urban Adoption %', 'Rural Adoption %'])
-        
-        fig_treatment = px.bar(treatment_adoption, x='Treatment Type', y=['Urban Adoption %', 'Rural Adoption %'],
-                              title='Treatment Adoption Patterns: Urban vs Rural', barmode='group',
-                              height=400)
-        st.plotly_chart(fig_treatment, use_container_width=True)
-        
-        # ✅ Treatment categories displayed directly
-        st.subheader("🍎 Lifestyle Interventions")
-        st.write("**Diet Modification:** Urban adoption 45.8%, Rural adoption 18.2%")
-        st.write("**Exercise Programs:** Urban adoption 38.2%, Rural adoption 12.8%")
-        
-        st.subheader("💉 GLP-1 Agonists")
-        st.write("**Current Adoption:** 4.2% overall")
-        st.write("**Urban Penetration:** 8.5%")
-        st.write("**Rural Penetration:** 0.8%")
-        
-        st.subheader("🔪 Bariatric Surgery")
-        st.write("**Cost Range:** ₹2.5-8.0 lakhs")
-        st.write("**Success Rate Perception:** 85.2%")
-        
-        # ✅ Clickable links
-        st.markdown("""
-        <div class="sources-section">
-            <h4>📍 Research Sources</h4>
-            <p><strong>Frontiers Medical Journal:</strong> <a href="https://www.frontiersin.org/journals/endocrinology" target="_blank">https://www.frontiersin.org/journals/endocrinology</a></p>
-            <p><strong>Economic Times Healthcare:</strong> <a href="https://economictimes.indiatimes.com/industry/healthcare" target="_blank">https://economictimes.indiatimes.com/industry/healthcare</a></p>
-            <p><strong>Clinical Trials Database:</strong> <a href="https://www.clinicaltrialsarena.com/" target="_blank">https://www.clinicaltrialsarena.com/</a></p>
-            <p><strong>IQVIA Analytics Platform:</strong> <a href="https://www.iqvia.com/" target="_blank">https://www.iqvia.com/</a></p>
-            <p><strong>IMA Medical Guidelines:</strong> <a href="https://www.ima-india.org/" target="_blank">https://www.ima-india.org/</a></p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("## 👥 Gender-Based Prevalence Analysis")
+    st.markdown("*Comprehensive analysis of obesity and comorbidity patterns by gender*")
+    
+    gender_data = comprehensive_analysis['gender_analysis']
+    
+    # Gender comparison visualization
+    fig_gender = _fig_gender()
+    st.plotly_chart(fig_gender, use_container_width=True)
+    
+    # ✅ Age-Wise Distribution Details (NO DROPDOWN - Always visible)
+    st.subheader("📊 Age-Wise Distribution Details")
+    male_data = gender_data['male_obesity']
+    female_data = gender_data['female_obesity']
+    
+    age_combined = _build_age_df(male_data, female_data)
+    
+    if not age_combined.empty:
+        fig_age = _fig_age(age_combined)
+        st.plotly_chart(fig_age, use_container_width=True)
+    
+    # ✅ Clickable links
+    st.markdown("""
+    <div class="sources-section">
+        <h4>📍 Research Sources</h4>
+        <p><strong>WHO Obesity Database:</strong> <a href="https://www.who.int/data/gho/data/themes/noncommunicable-diseases" target="_blank">https://www.who.int/data/gho/data/themes/noncommunicable-diseases</a></p>
+        <p><strong>ICMR Diabetes Study:</strong> <a href="https://www.icmr.gov.in/content/diabetes-studies" target="_blank">https://www.icmr.gov.in/content/diabetes-studies</a></p>
+        <p><strong>Lancet Medical Journal:</strong> <a href="https://www.thelancet.com/journals/landia/home" target="_blank">https://www.thelancet.com/journals/landia/home</a></p>
+        <p><strong>IJMR Publications:</strong> <a href="https://www.ijmr.org.in/" target="_blank">https://www.ijmr.org.in/</a></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_geographic_tab(comprehensive_analysis):
+    """Geographic segmentation and state rankings view"""
+    
+    st.markdown("## 🗺️ Geographic Analysis & State Rankings")  # ✅ Combined title
+    st.markdown("*Comprehensive geographic analysis with state rankings by patient count*")  # ✅ Combined description
+    
+    geographic_data = comprehensive_analysis['geographic_segmentation']
+    state_calculations = comprehensive_analysis['state_obese_calculations']
+    
+    # ✅ MERGED: State rankings by patient count (from old Rankings tab)
+    st.subheader("🏆 State Rankings by Total Obese Patients")
+    
+    display_ranking = _build_state_ranking_df(state_calculations)
+    
+    st.dataframe(display_ranking, use_container_width=True)
+    
+    # ✅ MERGED: Top 10 States visualization (from old Rankings tab)
+    st.subheader("📊 Top 10 States by Obese Patient Count")
+    top_10_states = display_ranking.head(10)
+    fig_top10 = _fig_top10(top_10_states)
+    st.plotly_chart(fig_top10, use_container_width=True)
+    
+    # ✅ District Analysis (from old Geographic tab)
+    st.subheader("🔝 Top 10 Districts by Obesity Prevalence")
+    st.dataframe(_TOP_DISTRICTS_DF, use_container_width=True)
+    
+    st.subheader("🔻 Bottom 10 Districts by Obesity Prevalence")
+    st.dataframe(_BOTTOM_DISTRICTS_DF, use_container_width=True)
+    
+    # Urban vs Rural Comparison with Hypertension
+    st.subheader("🏙️ Urban vs Rural Comparison")
+    
+    urban_rural_data = geographic_data['urban_rural_comparison']
+    comparison_df = _build_urban_rural_df(urban_rural_data)
+    
+    fig_urban_rural = _fig_urban_rural(comparison_df)
+    st.plotly_chart(fig_urban_rural, use_container_width=True)
+    
+    # ✅ City Tier Analysis with Hypertension
+    st.subheader("🎯 City Tier Analysis Details")
+    fig_tier = _fig_tier(geographic_data['tier_city_analysis'])
+    st.plotly_chart(fig_tier, use_container_width=True)
+    
+    # ✅ Clickable links (combined sources from both old tabs)
+    st.markdown("""
+    <div class="sources-section">
+        <h4>📍 Research Sources</h4>
+        <p><strong>Health Ministry Database:</strong> <a href="https://main.mohfw.gov.in/" target="_blank">https://main.mohfw.gov.in/</a></p>
+        <p><strong>Population Survey Office:</strong> <a href="https://www.nsso.gov.in/" target="_blank">https://www.nsso.gov.in/</a></p>
+        <p><strong>Indian Census Portal:</strong> <a href="https://censusindia.gov.in/" target="_blank">https://censusindia.gov.in/</a></p>
+        <p><strong>NFHS Health Survey:</strong> <a href="http://rchiips.org/nfhs/" target="_blank">http://rchiips.org/nfhs/</a></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_comorbidity_tab(comprehensive_analysis):
+    """Comorbidity correlation view"""
+    
+    st.markdown("## 🫀 Comorbidity & Risk Analysis")
+    st.markdown("*Correlations with heart disease, diabetes, hypertension*")
+    
+    comorbidity_data = comprehensive_analysis['comorbidity_analysis']
+    
+    # Correlation strength visualization
+    coefficients = tuple(comorbidity_data[key]['correlation_coefficient'] for key in _CORRELATION_KEYS)
+    
+    fig_corr = _fig_corr(coefficients)
+    st.plotly_chart(fig_corr, use_container_width=True)
+    
+    # ✅ BMI-based prevalence analysis (NO DROPDOWN - Always visible)
+    st.subheader("📈 Diabetes Prevalence by BMI Category")
+    prevalence_by_bmi = comorbidity_data['obesity_diabetes_correlation']['prevalence_by_bmi']
+    
+    fig_bmi = _fig_bmi(tuple(prevalence_by_bmi[category] for category in _BMI_CATEGORIES))
+    st.plotly_chart(fig_bmi, use_container_width=True)
+    
+    # ✅ Clickable links
+    st.markdown("""
+    <div class="sources-section">
+        <h4>📍 Research Sources</h4>
+        <p><strong>Global Diabetes Atlas:</strong> <a href="https://diabetesatlas.org/" target="_blank">https://diabetesatlas.org/</a></p>
+        <p><strong>NCBI Medical Database:</strong> <a href="https://www.ncbi.nlm.nih.gov/" target="_blank">https://www.ncbi.nlm.nih.gov/</a></p>
+        <p><strong>Nature Scientific Journal:</strong> <a href="https://www.nature.com/srep/" target="_blank">https://www.nature.com/srep/</a></p>
+        <p><strong>AHA Research Portal:</strong> <a href="https://www.heart.org/" target="_blank">https://www.heart.org/</a></p>
+        <p><strong>Novo Nordisk Clinical Data:</strong> <a href="https://www.novonordisk.com/about/who-we-are/medical-affairs.html" target="_blank">https://www.novonordisk.com/about/who-we-are/medical-affairs.html</a></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_treatment_tab(comprehensive_analysis):
+    """Treatment options view"""
+    
+    st.markdown("## 💊 Treatment Options")
+    st.markdown("*Available treatment interventions: GLP-1 agonists, lifestyle modifications, and surgical options*")
+    
+    treatment_data = comprehensive_analysis['treatment_patterns']
+    
+    # ✅ Treatment adoption comparison (REMOVED Traditional Diabetes entry)
+    treatment_adoption = _build_treatment_adoption_df(treatment_data)
+    
+    fig_treatment = _fig_treatment(treatment_adoption)
+    st.plotly_chart(fig_treatment, use_container_width=True)
+    
+    # ✅ Treatment categories displayed directly
+    st.subheader("🍎 Lifestyle Interventions")
+    st.write("**Diet Modification:** Urban adoption 45.8%, Rural adoption 18.2%")
+    st.write("**Exercise Programs:** Urban adoption 38.2%, Rural adoption 12.8%")
+    
+    st.subheader("💉 GLP-1 Agonists")
+    st.write("**Current Adoption:** 4.2% overall")
+    st.write("**Urban Penetration:** 8.5%")
+    st.write("**Rural Penetration:** 0.8%")
+    
+    st.subheader("🔪 Bariatric Surgery")
+    st.write("**Cost Range:** ₹2.5-8.0 lakhs")
+    st.write("**Success Rate Perception:** 85.2%")
+    
+    # ✅ Clickable links
+    st.markdown("""
+    <div class="sources-section">
+        <h4>📍 Research Sources</h4>
+        <p><strong>Frontiers Medical Journal:</strong> <a href="https://www.frontiersin.org/journals/endocrinology" target="_blank">https://www.frontiersin.org/journals/endocrinology</a></p>
+        <p><strong>Economic Times Healthcare:</strong> <a href="https://economictimes.indiatimes.com/industry/healthcare" target="_blank">https://economictimes.indiatimes.com/industry/healthcare</a></p>
+        <p><strong>Clinical Trials Database:</strong> <a href="https://www.clinicaltrialsarena.com/" target="_blank">https://www.clinicaltrialsarena.com/</a></p>
+        <p><strong>IQVIA Analytics Platform:</strong> <a href="https://www.iqvia.com/" target="_blank">https://www.iqvia.com/</a></p>
+        <p><strong>IMA Medical Guidelines:</strong> <a href="https://www.ima-india.org/" target="_blank">https://www.ima-india.org/</a></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# ✅ View label -> renderer (Rankings merged into Geographic - 4 views)
+_VIEWS = {
+    "👥 Gender": render_gender_tab,
+    "🗺️ Geographic & Rankings": render_geographic_tab,
+    "🫀 Comorbidity": render_comorbidity_tab,
+    "💊 Treatment": render_treatment_tab
+}
+
+def _build_export_report(timestamp, comprehensive_analysis, data_sources):
+    """Serialized comprehensive market report"""
+    export_data = {
+        'analysis_timestamp': timestamp,
+        'gender_analysis': comprehensive_analysis['gender_analysis'],
+        'geographic_segmentation': comprehensive_analysis['geographic_segmentation'],
+        'comorbidity_analysis': comprehensive_analysis['comorbidity_analysis'],
+        'treatment_patterns': comprehensive_analysis['treatment_patterns'],
+        'state_obese_calculations': comprehensive_analysis['state_obese_calculations'],
+        'data_sources': data_sources,
+        'methodology': 'Mobile-responsive comprehensive market analysis with population-based calculations'
+    }
+    return _dumps(export_data)
+
+@st.fragment
+def _render_views(comprehensive_analysis):
+    """View selector and active view; switching views reruns only this fragment"""
+    
+    # ✅ Tab-style view selector - only the selected view is rendered on each rerun
+    active_view = st.radio(
+        "Analysis view",
+        list(_VIEWS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
+    _VIEWS[active_view](comprehensive_analysis)
+
+@st.fragment
+def _render_export(comprehensive_analysis, data_sources):
+    """Report export; button clicks rerun only this fragment"""
     
     # ✅ EXPORT FUNCTIONALITY
     st.markdown("---")
@@ -779,18 +888,7 @@ def main():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M')
         
         # Create comprehensive export
-        export_data = {
-            'analysis_timestamp': timestamp,
-            'gender_analysis': comprehensive_analysis['gender_analysis'],
-            'geographic_segmentation': comprehensive_analysis['geographic_segmentation'],
-            'comorbidity_analysis': comprehensive_analysis['comorbidity_analysis'],
-            'treatment_patterns': comprehensive_analysis['treatment_patterns'],
-            'state_obese_calculations': comprehensive_analysis['state_obese_calculations'],
-            'data_sources': intelligence_engine.comprehensive_sources,
-            'methodology': 'Mobile-responsive comprehensive market analysis with population-based calculations'
-        }
-        
-        export_json = json.dumps(export_data, indent=2, default=str)
+        export_json = _build_export_report(timestamp, comprehensive_analysis, data_sources)
         st.download_button(
             "Download Complete Analysis",
             export_json,
@@ -800,5 +898,22 @@ def main():
         
         st.success("✅ Mobile-optimized comprehensive market analysis ready for download")
 
+def main():
+    """Main application with mobile-responsive design"""
+    
+    # ✅ MOBILE-FIRST RESPONSIVE CSS
+    st.markdown(_STYLE_HTML, unsafe_allow_html=True)
+    
+    # ✅ UPDATED HEADER (removed Rankings from analysis areas)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Initialize engine with loading spinner
+    with st.spinner('🔄 Loading market intelligence data...'):
+        intelligence_engine = get_engine()
+        comprehensive_analysis = _cached_rankings()
+    
+    _render_views(comprehensive_analysis)
+    _render_export(comprehensive_analysis, intelligence_engine.comprehensive_sources)
+
 if __name__ == "__main__":
     main()